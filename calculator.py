@@ -1,10 +1,52 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-import math
+import logging
+import queue
+import threading
 import time
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the helpers below run as plain Python/NumPy
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Operation codes for the compiled arithmetic helper
+OPERATION_IDS = {'+': 0, '-': 1, '×': 2, '÷': 3}
+
+@njit(cache=True)
+def _calc(n1, n2, op_id):
+    """Apply an operation code to two floats"""
+    if op_id == 0:
+        return n1 + n2
+    elif op_id == 1:
+        return n1 - n2
+    elif op_id == 2:
+        return n1 * n2
+    return n1 / n2
+
+@njit(cache=True)
+def _touch_hittest(fx, fy, rects, centers, thresh2):
+    """Index of the button whose rect contains the point and whose center is
+    closest within sqrt(thresh2), or -1"""
+    inside = (fx >= rects[:, 0]) & (fx <= rects[:, 2]) & (fy >= rects[:, 1]) & (fy <= rects[:, 3])
+    dx = centers[:, 0] - fx
+    dy = centers[:, 1] - fy
+    dist2 = np.where(inside, dx * dx + dy * dy, thresh2)
+    idx = dist2.argmin()
+    return idx if dist2[idx] < thresh2 else -1
+
+def _warm_up_jit():
+    """Compile the njit helpers with the argument types used at runtime, so the
+    first touch doesn't stall the render loop"""
+    _calc(1.0, 1.0, 0)
+    _touch_hittest(0, 0, np.zeros((1, 4), dtype=np.int32), np.zeros((1, 2), dtype=np.int32), 1)
+
 class VirtualTouchCalculator:
     def __init__(self):
         # Initialize MediaPipe hands
@@ -12,10 +54,25 @@ class VirtualTouchCalculator:
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
-            min_detection_confidence=0.8,
-            min_tracking_confidence=0.7
+            model_complexity=0,  # Lite landmark model
+            min_detection_confidence=0.6,
+            min_tracking_confidence=0.5  # Keep tracking instead of re-detecting the palm
         )
         self.mp_drawing = mp.solutions.drawing_utils
+        self._hand_connections = np.array(list(self.mp_hands.HAND_CONNECTIONS), dtype=np.int32)
+        self.inference_size = (640, 360)  # Frame size passed to MediaPipe
+        
+        # Adaptive inference: once the fingertip has held still for a while,
+        # reuse the last landmarks on some frames instead of running MediaPipe
+        self.still_radius = 3  # Max tip movement (inference-frame pixels) counted as still
+        self.still_frames = 5  # Consecutive still inferences before skipping starts
+        self.max_inference_skips = 1  # Reused frames in a row (1 = every other frame)
+        self._force_inference = threading.Event()  # Set on button press
+        self._capture_error = None  # Exception raised on the capture thread
+        
+        # Opt-in: flip/resize camera frames through OpenCL (T-API). Off by
+        # default since the upload/download can outweigh the CPU cost.
+        self.use_opencl = False
         
         # Calculator state
         self.current_number = ""
@@ -24,6 +81,7 @@ class VirtualTouchCalculator:
         self.display = "0"
         self.history = []
         self.just_calculated = False
+        self.error = False  # Display is showing an error
         
         # Touch detection
         self.finger_tip_id = 8  # Index finger tip
@@ -31,12 +89,18 @@ class VirtualTouchCalculator:
         self.touch_cooldown = 0.3  # 300ms cooldown between touches
         self.touch_threshold = 30  # pixels distance for touch detection
         self.button_pressed = None
-        self.button_press_time = 0
         self.press_duration = 0.2  # Visual feedback duration
         
         # UI settings
         self.theme = "dark"
         self.show_instructions = True
+        self.show_hand_overlay = True
+        self.panel_width = 400
+        self.history_y = 550
+        
+        # Pre-rendered static panel (background, display frame, idle buttons)
+        self._panel_cache = None
+        self._panel_cache_key = None
         
         # Button layout - calculator style
         self.button_layout = [
@@ -47,8 +111,22 @@ class VirtualTouchCalculator:
             ['0', '.', '=', 'del']
         ]
         
-        # Button regions (will be calculated)
-        self.buttons = {}
+        # Button regions and state (filled in by setup_buttons), stored as
+        # parallel arrays indexed by button id; _btn_idx maps label -> id
+        self._btn_names = []
+        self._btn_idx = {}
+        self._btn_rects = np.empty((0, 4), dtype=np.int32)
+        self._btn_centers = np.empty((0, 2), dtype=np.int32)
+        self._btn_font_scales = np.empty(0, dtype=np.float32)
+        self._btn_text_pos = np.empty((0, 2), dtype=np.int32)
+        self._btn_hover = np.empty(0, dtype=np.bool_)
+        self._btn_pressed = np.empty(0, dtype=np.bool_)
+        self._btn_press_time = np.empty(0, dtype=np.float64)
+        
+        # Per button: (neighbor ids, their rects, their centers), and the
+        # button hit on the previous frame (-1 if none)
+        self._btn_neighborhoods = []
+        self._last_touched_idx = -1
         
         # Color themes
         self.themes = {
@@ -87,9 +165,7 @@ class VirtualTouchCalculator:
     def setup_buttons(self, frame_width, frame_height):
         """Setup button positions and sizes"""
         # Calculator panel dimensions
-        panel_width = 400
-        panel_height = frame_height
-        panel_x = frame_width - panel_width
+        panel_x = frame_width - self.panel_width
         
         # Button dimensions
         button_width = 80
@@ -100,7 +176,8 @@ class VirtualTouchCalculator:
         start_x = panel_x + 20
         start_y = 200  # Below the display
         
-        self.buttons.clear()
+        names, rects, centers = [], [], []
+        font_scales, text_pos = [], []
         
         for row_idx, row in enumerate(self.button_layout):
             for col_idx, button_text in enumerate(row):
@@ -113,80 +190,99 @@ class VirtualTouchCalculator:
                 else:
                     width = button_width
                 
-                self.buttons[button_text] = {
-                    'rect': (x, y, x + width, y + button_height),
-                    'center': (x + width // 2, y + button_height // 2),
-                    'pressed': False,
-                    'hover': False
-                }
+                # Label metrics are fixed per button, so measure them once
+                font_scale = 1.2 if len(button_text) == 1 else 0.8
+                text_size = cv2.getTextSize(button_text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+                
+                names.append(button_text)
+                rects.append((x, y, x + width, y + button_height))
+                centers.append((x + width // 2, y + button_height // 2))
+                font_scales.append(font_scale)
+                text_pos.append((x + (width - text_size[0]) // 2,
+                                 y + (button_height + text_size[1]) // 2))
+        
+        n = len(names)
+        self._btn_names = names
+        self._btn_idx = {name: i for i, name in enumerate(names)}
+        self._btn_rects = np.array(rects, dtype=np.int32)
+        self._btn_centers = np.array(centers, dtype=np.int32)
+        self._btn_font_scales = np.array(font_scales, dtype=np.float32)
+        self._btn_text_pos = np.array(text_pos, dtype=np.int32)
+        self._btn_hover = np.zeros(n, dtype=np.bool_)
+        self._btn_pressed = np.zeros(n, dtype=np.bool_)
+        self._btn_press_time = np.zeros(n, dtype=np.float64)
+        
+        # Neighbors are the buttons whose rects come within one button pitch,
+        # i.e. the button itself plus its 8-connected grid neighbors
+        r = self._btn_rects
+        pitch = np.array([-(button_width + button_margin), -(button_height + button_margin),
+                          button_width + button_margin, button_height + button_margin])
+        grown = r + pitch
+        near = ((r[None, :, 0] <= grown[:, None, 2]) & (r[None, :, 2] >= grown[:, None, 0]) &
+                (r[None, :, 1] <= grown[:, None, 3]) & (r[None, :, 3] >= grown[:, None, 1]))
+        self._btn_neighborhoods = []
+        for row in near:
+            ids = np.flatnonzero(row)
+            self._btn_neighborhoods.append((ids, r[ids], self._btn_centers[ids]))
+        self._last_touched_idx = -1
+    
+    def landmarks_to_array(self, landmarks):
+        """Convert MediaPipe landmarks to a (21, 3) array of normalized x, y, z"""
+        return np.fromiter((v for p in landmarks for v in (p.x, p.y, p.z)),
+                           dtype=np.float32, count=63).reshape(21, 3)
     
     def get_finger_position(self, landmarks, frame_width, frame_height):
         """Get index finger tip position"""
-        if landmarks:
-            finger_tip = landmarks[self.finger_tip_id]
-            x = int(finger_tip.x * frame_width)
-            y = int(finger_tip.y * frame_height)
+        if landmarks is not None:
+            x = int(landmarks[self.finger_tip_id, 0] * frame_width)
+            y = int(landmarks[self.finger_tip_id, 1] * frame_height)
             return (x, y)
         return None
     
-    def is_point_in_rect(self, point, rect):
-        """Check if point is inside rectangle"""
-        x, y = point
-        x1, y1, x2, y2 = rect
-        return x1 <= x <= x2 and y1 <= y <= y2
-    
-    def calculate_distance(self, point1, point2):
-        """Calculate Euclidean distance between two points"""
-        return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
-    
     def detect_button_touch(self, finger_pos):
         """Detect which button is being touched"""
-        if not finger_pos:
-            # Reset all hover states
-            for button in self.buttons.values():
-                button['hover'] = False
+        # Reset all hover states
+        self._btn_hover[:] = False
+        
+        if not finger_pos or not self._btn_names:
+            self._last_touched_idx = -1
             return None
         
-        touched_button = None
-        min_distance = float('inf')
+        # Squared distances avoid the sqrt
+        fx, fy = finger_pos
+        thresh2 = self.touch_threshold ** 2
         
-        # Check each button
-        for button_text, button_data in self.buttons.items():
-            rect = button_data['rect']
-            center = button_data['center']
-            
-            # Check if finger is over button
-            if self.is_point_in_rect(finger_pos, rect):
-                distance = self.calculate_distance(finger_pos, center)
-                if distance < self.touch_threshold and distance < min_distance:
-                    min_distance = distance
-                    touched_button = button_text
-                    button_data['hover'] = True
-                else:
-                    button_data['hover'] = False
-            else:
-                button_data['hover'] = False
+        # The finger usually stays on or next to the last button, so try
+        # that neighborhood before scanning the whole keypad
+        idx = -1
+        if self._last_touched_idx >= 0:
+            ids, rects, centers = self._btn_neighborhoods[self._last_touched_idx]
+            hit = _touch_hittest(fx, fy, rects, centers, thresh2)
+            if hit >= 0:
+                idx = int(ids[hit])
         
-        return touched_button
+        if idx < 0:
+            idx = _touch_hittest(fx, fy, self._btn_rects, self._btn_centers, thresh2)
+        
+        self._last_touched_idx = idx
+        if idx < 0:
+            return None
+        
+        self._btn_hover[idx] = True
+        return self._btn_names[idx]
     
     def is_touching_gesture(self, landmarks):
         """Detect if user is making a touching gesture (index finger extended)"""
-        if not landmarks:
+        if landmarks is None:
             return False
         
-        # Check if only index finger is extended
-        finger_tips = [4, 8, 12, 16, 20]  # thumb, index, middle, ring, pinky
-        finger_pips = [3, 6, 10, 14, 18]
+        # Index finger (tip 8, pip 6) should be extended
+        index_extended = landmarks[8, 1] < landmarks[6, 1]
         
-        # Index finger should be extended
-        index_extended = landmarks[finger_tips[1]].y < landmarks[finger_pips[1]].y
+        # Middle, ring and pinky tips should be below their pips (thumb is ignored)
+        others_closed = np.all(landmarks[[12, 16, 20], 1] > landmarks[[10, 14, 18], 1])
         
-        # Other fingers should be closed (except thumb which has different logic)
-        middle_closed = landmarks[finger_tips[2]].y > landmarks[finger_pips[2]].y
-        ring_closed = landmarks[finger_tips[3]].y > landmarks[finger_pips[3]].y
-        pinky_closed = landmarks[finger_tips[4]].y > landmarks[finger_pips[4]].y
-        
-        return index_extended and middle_closed and ring_closed and pinky_closed
+        return bool(index_extended and others_closed)
     
     def process_button_press(self, button_text):
         """Process button press with calculator logic"""
@@ -196,13 +292,15 @@ class VirtualTouchCalculator:
         if current_time - self.last_touch_time < self.touch_cooldown:
             return
         
-        print(f"Button pressed: {button_text}")
+        logger.debug("Button pressed: %s", button_text)
+        self._force_inference.set()
         
         # Mark button as pressed for visual feedback
-        if button_text in self.buttons:
-            self.buttons[button_text]['pressed'] = True
+        idx = self._btn_idx.get(button_text)
+        if idx is not None:
+            self._btn_pressed[idx] = True
+            self._btn_press_time[idx] = current_time
             self.button_pressed = button_text
-            self.button_press_time = current_time
         
         # Process the button press
         if button_text.isdigit():
@@ -211,12 +309,13 @@ class VirtualTouchCalculator:
                 self.current_number = button_text
                 self.just_calculated = False
             else:
-                if self.display == "0" or "Error" in self.display:
+                if self.display == "0" or self.error:
                     self.display = button_text
                 else:
                     if len(self.display) < 12:  # Limit display length
                         self.display += button_text
                 self.current_number = self.display
+            self.error = False
         
         elif button_text == '.':
             if '.' not in self.display and not self.just_calculated:
@@ -230,12 +329,12 @@ class VirtualTouchCalculator:
             if self.current_number:
                 if self.operation and self.previous_number:
                     # Chain operations
-                    result = self.calculate(self.previous_number, self.operation, self.current_number)
-                    if "Error" not in result:
+                    ok, result = self.calculate(self.previous_number, self.operation, self.current_number)
+                    self.display = result
+                    self.error = not ok
+                    if ok:
                         self.previous_number = result
-                        self.display = result
                     else:
-                        self.display = result
                         self.last_touch_time = current_time
                         return
                 else:
@@ -247,7 +346,7 @@ class VirtualTouchCalculator:
         
         elif button_text == '=':
             if self.current_number and self.operation and self.previous_number:
-                result = self.calculate(self.previous_number, self.operation, self.current_number)
+                ok, result = self.calculate(self.previous_number, self.operation, self.current_number)
                 
                 # Add to history
                 history_entry = f"{self.previous_number} {self.operation} {self.current_number} = {result}"
@@ -256,7 +355,8 @@ class VirtualTouchCalculator:
                     self.history.pop(0)
                 
                 self.display = result
-                self.current_number = result if "Error" not in result else ""
+                self.error = not ok
+                self.current_number = result if ok else ""
                 self.previous_number = ""
                 self.operation = ""
                 self.just_calculated = True
@@ -267,9 +367,14 @@ class VirtualTouchCalculator:
             self.operation = ""
             self.display = "0"
             self.just_calculated = False
+            self.error = False
         
         elif button_text == 'del':
-            if not self.just_calculated and len(self.display) > 1:
+            if self.error:
+                self.display = "0"
+                self.current_number = ""
+                self.error = False
+            elif not self.just_calculated and len(self.display) > 1:
                 self.display = self.display[:-1]
                 self.current_number = self.display
             elif len(self.display) == 1:
@@ -283,6 +388,7 @@ class VirtualTouchCalculator:
                 else:
                     self.current_number = '-' + self.current_number
                 self.display = self.current_number
+                self.error = False
         
         elif button_text == '%':
             if self.current_number:
@@ -290,45 +396,43 @@ class VirtualTouchCalculator:
                     result = str(float(self.current_number) / 100)
                     self.display = result
                     self.current_number = result
+                    self.error = False
                 except:
                     self.display = "Error"
+                    self.error = True
         
         self.last_touch_time = current_time
     
     def calculate(self, num1, operation, num2):
-        """Perform calculation"""
+        """Perform calculation, returning (ok, display text)"""
         try:
             n1, n2 = float(num1), float(num2)
             
-            if operation == '+':
-                result = n1 + n2
-            elif operation == '-':
-                result = n1 - n2
-            elif operation == '×':
-                result = n1 * n2
-            elif operation == '÷':
-                if n2 == 0:
-                    return "Error"
-                result = n1 / n2
-            else:
-                return "Error"
+            if operation not in OPERATION_IDS:
+                return False, "Error"
+            if operation == '÷' and n2 == 0:
+                return False, "Error"
+            result = _calc(n1, n2, OPERATION_IDS[operation])
             
             # Format result
             if abs(result) > 999999999 or abs(result) < 0.000001 and result != 0:
-                return f"{result:.2e}"
+                return True, f"{result:.2e}"
             elif result == int(result):
-                return str(int(result))
+                return True, str(int(result))
             else:
-                return f"{result:.8f}".rstrip('0').rstrip('.')
+                return True, f"{result:.8f}".rstrip('0').rstrip('.')
                 
         except:
-            return "Error"
+            return False, "Error"
     
-    def draw_button(self, frame, button_text, button_data):
-        """Draw individual button with proper styling"""
+    def draw_button(self, frame, idx, static=False):
+        """Draw individual button with proper styling (static=True ignores hover/press state)"""
         colors = self.themes[self.theme]
-        rect = button_data['rect']
-        x1, y1, x2, y2 = rect
+        button_text = self._btn_names[idx]
+        x1, y1, x2, y2 = self._btn_rects[idx].tolist()
+        pressed = self._btn_pressed[idx] and not static
+        hover = self._btn_hover[idx] and not static
+        press_age = time.time() - self._btn_press_time[idx]
         
         # Determine button color based on type and state
         if button_text.isdigit() or button_text == '.':
@@ -339,9 +443,9 @@ class VirtualTouchCalculator:
             base_color = colors['special_button']
         
         # Apply state-based color modifications
-        if button_data['pressed'] and time.time() - self.button_press_time < self.press_duration:
+        if pressed and press_age < self.press_duration:
             button_color = colors['button_pressed']
-        elif button_data['hover']:
+        elif hover:
             button_color = colors['button_hover']
         else:
             button_color = base_color
@@ -350,25 +454,50 @@ class VirtualTouchCalculator:
         cv2.rectangle(frame, (x1, y1), (x2, y2), button_color, -1)
         
         # Draw button border
-        border_color = colors['accent'] if button_data['hover'] else colors['text']
-        border_thickness = 3 if button_data['hover'] else 1
+        border_color = colors['accent'] if hover else colors['text']
+        border_thickness = 3 if hover else 1
         cv2.rectangle(frame, (x1, y1), (x2, y2), border_color, border_thickness)
         
-        # Draw button text
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 1.2 if len(button_text) == 1 else 0.8
+        # Draw button text, centered using the metrics from setup_buttons
         text_color = colors['text'] if button_text not in ['+', '-', '×', '÷', '='] else (255, 255, 255)
+        cv2.putText(frame, button_text, tuple(self._btn_text_pos[idx].tolist()), cv2.FONT_HERSHEY_SIMPLEX,
+                    float(self._btn_font_scales[idx]), text_color, 2)
         
-        # Center the text
-        text_size = cv2.getTextSize(button_text, font, font_scale, 2)[0]
-        text_x = x1 + (x2 - x1 - text_size[0]) // 2
-        text_y = y1 + (y2 - y1 + text_size[1]) // 2
+        # Reset pressed state after duration
+        if pressed and press_age > self.press_duration:
+            self._btn_pressed[idx] = False
+    
+    def render_panel(self, frame_width, frame_height):
+        """Render the static part of the calculator panel into a bitmap"""
+        w, h = frame_width, frame_height
+        colors = self.themes[self.theme]
+        panel_x = w - self.panel_width
         
-        cv2.putText(frame, button_text, (text_x, text_y), font, font_scale, text_color, 2)
+        # Draw in frame coordinates, then keep only the panel columns
+        canvas = np.zeros((h, w, 3), dtype=np.uint8)
         
-        # Reset pressed state after duration
-        if button_data['pressed'] and time.time() - self.button_press_time > self.press_duration:
-            button_data['pressed'] = False
+        # Panel background and border
+        cv2.rectangle(canvas, (panel_x, 0), (w, h), colors['panel'], -1)
+        cv2.rectangle(canvas, (panel_x, 0), (w, h), colors['accent'], 2)
+        
+        # Title
+        cv2.putText(canvas, "VIRTUAL TOUCH CALCULATOR", (panel_x + 20, 30), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, colors['accent'], 2)
+        
+        # Display screen
+        display_rect = (panel_x + 20, 50, w - 20, 150)
+        cv2.rectangle(canvas, display_rect[:2], display_rect[2:], colors['display_bg'], -1)
+        cv2.rectangle(canvas, display_rect[:2], display_rect[2:], colors['accent'], 3)
+        
+        # Buttons in their idle state
+        for idx in range(len(self._btn_names)):
+            self.draw_button(canvas, idx, static=True)
+        
+        # History header
+        cv2.putText(canvas, "RECENT CALCULATIONS:", (panel_x + 20, self.history_y), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, colors['accent'], 2)
+        
+        return canvas[:, panel_x:].copy()
     
     def draw_calculator_interface(self, frame):
         """Draw the complete calculator interface"""
@@ -376,36 +505,25 @@ class VirtualTouchCalculator:
         colors = self.themes[self.theme]
         
         # Setup buttons if not already done
-        if not self.buttons:
+        if not self._btn_names:
             self.setup_buttons(w, h)
         
-        # Calculator panel background
-        panel_width = 400
-        panel_x = w - panel_width
-        
-        # Semi-transparent overlay
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (panel_x, 0), (w, h), colors['panel'], -1)
-        cv2.addWeighted(overlay, 0.95, frame, 0.05, 0, frame)
-        
-        # Panel border
-        cv2.rectangle(frame, (panel_x, 0), (w, h), colors['accent'], 2)
-        
-        # Title
-        cv2.putText(frame, "VIRTUAL TOUCH CALCULATOR", (panel_x + 20, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, colors['accent'], 2)
+        # Re-render the static panel only when theme or frame size changes
+        cache_key = (self.theme, w, h)
+        if self._panel_cache is None or self._panel_cache_key != cache_key:
+            self._panel_cache = self.render_panel(w, h)
+            self._panel_cache_key = cache_key
         
-        # Display screen
-        display_rect = (panel_x + 20, 50, w - 20, 150)
-        cv2.rectangle(frame, display_rect[:2], display_rect[2:], colors['display_bg'], -1)
-        cv2.rectangle(frame, display_rect[:2], display_rect[2:], colors['accent'], 3)
+        # Paint the panel opaque; at 95% alpha the blend was barely visible
+        panel_x = w - self.panel_width
+        frame[:, panel_x:] = self._panel_cache
         
         # Display text (right-aligned)
         display_text = self.display
         if len(display_text) > 15:
             display_text = display_text[-15:]  # Show last 15 characters
         
-        text_color = colors['error'] if 'Error' in display_text else colors['text']
+        text_color = colors['error'] if self.error else colors['text']
         font_scale = 2.0 if len(display_text) <= 8 else 1.5
         
         text_size = cv2.getTextSize(display_text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 3)[0]
@@ -421,19 +539,14 @@ class VirtualTouchCalculator:
             cv2.putText(frame, op_text, (panel_x + 25, 175), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, colors['accent'], 1)
         
-        # Draw all buttons
-        for button_text, button_data in self.buttons.items():
-            self.draw_button(frame, button_text, button_data)
-        
-        # History section
-        history_y = 550
-        cv2.putText(frame, "RECENT CALCULATIONS:", (panel_x + 20, history_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, colors['accent'], 2)
+        # Redraw only buttons that differ from the cached idle state
+        for idx in np.flatnonzero(self._btn_hover | self._btn_pressed).tolist():
+            self.draw_button(frame, idx)
         
         # Show recent history
         for i, calc in enumerate(self.history[-4:]):
             calc_text = calc[:35] + "..." if len(calc) > 35 else calc
-            y_pos = history_y + 30 + i * 25
+            y_pos = self.history_y + 30 + i * 25
             cv2.putText(frame, calc_text, (panel_x + 25, y_pos), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.45, colors['text'], 1)
     
@@ -451,7 +564,8 @@ class VirtualTouchCalculator:
             "",
             "KEYBOARD SHORTCUTS:",
             "Q: Quit  T: Theme  I: Instructions",
-            "R: Reset History  C: Clear"
+            "R: Reset History  C: Clear",
+            "H: Hand Overlay"
         ]
         
         # Instructions background
@@ -467,39 +581,123 @@ class VirtualTouchCalculator:
             cv2.putText(frame, instruction, (20, 40 + i * 30), 
                        cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness)
     
-    def draw_finger_tracking(self, frame, landmarks, finger_pos):
-        """Draw finger tracking visualization"""
-        if not landmarks:
+    def draw_finger_tracking(self, frame, landmarks, finger_pos, draw_skeleton=True):
+        """Draw finger tracking visualization (only the touch indicator if draw_skeleton is False)"""
+        if landmarks is None:
             return
             
         colors = self.themes[self.theme]
         
-        # Draw hand skeleton
-        connections = self.mp_hands.HAND_CONNECTIONS
-        for connection in connections:
-            start_idx, end_idx = connection
-            start = landmarks[start_idx]
-            end = landmarks[end_idx]
-            
-            start_pos = (int(start.x * frame.shape[1]), int(start.y * frame.shape[0]))
-            end_pos = (int(end.x * frame.shape[1]), int(end.y * frame.shape[0]))
-            
-            cv2.line(frame, start_pos, end_pos, colors['accent'], 2)
+        # Draw touch indicator
+        if finger_pos:
+            cv2.circle(frame, finger_pos, 25, colors['success'], 2)
+        
+        if not draw_skeleton:
+            return
+        
+        h, w = frame.shape[:2]
+        
+        # Pixel coordinates of all joints in one go
+        pts = (landmarks[:, :2] * (w, h)).astype(np.int32)
+        
+        # Draw hand skeleton: every connection as a two-point polyline, one call
+        cv2.polylines(frame, pts[self._hand_connections], False, colors['accent'], 2)
         
         # Highlight finger joints
-        for i, landmark in enumerate(landmarks):
-            x = int(landmark.x * frame.shape[1])
-            y = int(landmark.y * frame.shape[0])
-            
+        for i, (x, y) in enumerate(pts.tolist()):
             if i == self.finger_tip_id:  # Index finger tip
                 cv2.circle(frame, (x, y), 12, colors['success'], -1)
                 cv2.circle(frame, (x, y), 12, (255, 255, 255), 3)
             else:
                 cv2.circle(frame, (x, y), 6, colors['accent'], -1)
-        
-        # Draw touch indicator
-        if finger_pos:
-            cv2.circle(frame, finger_pos, 25, colors['success'], 2)
+    
+    def capture_loop(self, cap, frames, stop_event):
+        """Read camera frames and run hand detection, keeping only the newest result"""
+        # Reused every frame instead of letting resize/cvtColor allocate new arrays
+        inference_w, inference_h = self.inference_size
+        small = np.empty((inference_h, inference_w, 3), dtype=np.uint8)
+        rgb_small = np.empty((inference_h, inference_w, 3), dtype=np.uint8)
+        if self.use_opencl:
+            small_umat = cv2.UMat(inference_h, inference_w, cv2.CV_8UC3)
+            rgb_umat = cv2.UMat(inference_h, inference_w, cv2.CV_8UC3)
+        
+        # Fingertip stability tracking for adaptive inference
+        landmarks = None
+        prev_tip = None
+        still_count = 0
+        skipped = 0
+        
+        # Always release the main loop, even if capture or inference raises;
+        # run() re-raises the saved error once the thread has finished
+        try:
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                
+                # Flip frame for mirror effect
+                if self.use_opencl:
+                    uframe = cv2.flip(cv2.UMat(frame), 1)
+                    frame = uframe.get()
+                else:
+                    frame = cv2.flip(frame, 1)
+                
+                # A button press means the hand is moving again
+                if self._force_inference.is_set():
+                    self._force_inference.clear()
+                    still_count = 0
+                
+                # While the fingertip holds still, reuse the previous landmarks
+                if still_count >= self.still_frames and skipped < self.max_inference_skips:
+                    skipped += 1
+                else:
+                    skipped = 0
+                    
+                    # Downscale for MediaPipe; landmarks are normalized so they
+                    # still map onto the full-size frame
+                    # Then convert to RGB, on the small frame only
+                    if self.use_opencl:
+                        cv2.resize(uframe, self.inference_size, dst=small_umat, interpolation=cv2.INTER_AREA)
+                        cv2.cvtColor(small_umat, cv2.COLOR_BGR2RGB, dst=rgb_umat)
+                        rgb_input = rgb_umat.get()
+                    else:
+                        cv2.resize(frame, self.inference_size, dst=small, interpolation=cv2.INTER_AREA)
+                        rgb_small.flags.writeable = True
+                        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_small)
+                        rgb_input = rgb_small
+                    rgb_input.flags.writeable = False
+                    results = self.hands.process(rgb_input)
+                    
+                    # Only one hand is tracked; hand it over as a plain array
+                    landmarks = None
+                    if results.multi_hand_landmarks:
+                        landmarks = self.landmarks_to_array(results.multi_hand_landmarks[0].landmark)
+                    
+                    # Count consecutive inferences where the tip barely moved
+                    tip = None
+                    if landmarks is not None:
+                        tip = landmarks[self.finger_tip_id, :2] * self.inference_size
+                    if tip is not None and prev_tip is not None and \
+                            np.hypot(*(tip - prev_tip)) <= self.still_radius:
+                        still_count += 1
+                    else:
+                        still_count = 0
+                    prev_tip = tip
+                
+                # Drop a stale frame the main thread hasn't picked up yet
+                try:
+                    frames.put_nowait((frame, landmarks))
+                except queue.Full:
+                    try:
+                        frames.get_nowait()
+                    except queue.Empty:
+                        pass
+                    frames.put_nowait((frame, landmarks))
+        except Exception as e:
+            self._capture_error = e
+        finally:
+            # Camera failure ends the main loop too
+            stop_event.set()
     
     def run(self):
         """Main application loop"""
@@ -507,48 +705,69 @@ class VirtualTouchCalculator:
         print("Point with your INDEX finger and touch the virtual buttons!")
         
         cap = cv2.VideoCapture(0)
+        # MJPG lets USB webcams deliver 720p at full frame rate (YUYV usually can't)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        cap.set(cv2.CAP_PROP_FPS, 60)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Don't queue up stale frames
         
         if not cap.isOpened():
             print("Error: Could not open camera")
             return
         
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc_text = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4))
+        print(f"Camera format: {fourcc_text} @ {cap.get(cv2.CAP_PROP_FPS):.0f} FPS")
+        # Only touch OpenCV's global OpenCL switch when the path was asked for
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            self.use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        print(f"OpenCL acceleration: {'on' if self.use_opencl else 'off'}")
+        
+        _warm_up_jit()
+        
         print("Camera ready! Keep other fingers closed, point with index finger.")
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
+        # Capture and hand detection run on a producer thread; drawing,
+        # button handling and keyboard input stay on the main thread
+        frames = queue.Queue(maxsize=1)
+        stop_event = threading.Event()
+        self._capture_error = None
+        producer = threading.Thread(target=self.capture_loop,
+                                    args=(cap, frames, stop_event), daemon=True)
+        producer.start()
+        
+        while not stop_event.is_set():
+            try:
+                frame, landmarks = frames.get(timeout=0.1)
+            except queue.Empty:
+                # Keep the window responsive while waiting for a frame
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q') or key == ord('Q'):
+                    break
+                continue
             
-            # Flip frame for mirror effect
-            frame = cv2.flip(frame, 1)
             h, w = frame.shape[:2]
             
-            # Convert to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
-            
             finger_pos = None
             touching = False
             
             # Process hand landmarks
-            if results.multi_hand_landmarks:
-                for hand_landmarks in results.multi_hand_landmarks:
-                    landmarks = hand_landmarks.landmark
-                    
-                    # Get finger position
-                    finger_pos = self.get_finger_position(landmarks, w, h)
-                    
-                    # Check if making touching gesture
-                    touching = self.is_touching_gesture(landmarks)
-                    
-                    # Draw hand tracking
-                    self.draw_finger_tracking(frame, landmarks, finger_pos)
+            if landmarks is not None:
+                # Get finger position
+                finger_pos = self.get_finger_position(landmarks, w, h)
+                
+                # Check if making touching gesture
+                touching = self.is_touching_gesture(landmarks)
             
             # Detect button interaction
             touched_button = self.detect_button_touch(finger_pos)
             
+            # Draw hand tracking; the full skeleton only while interacting
+            draw_skeleton = self.show_hand_overlay and (touching or touched_button is not None)
+            self.draw_finger_tracking(frame, landmarks, finger_pos, draw_skeleton)
+            
             # Process touch if touching gesture is detected
             if touching and touched_button:
                 self.process_button_press(touched_button)
@@ -578,15 +797,23 @@ class VirtualTouchCalculator:
                 break
             elif key == ord('t') or key == ord('T'):
                 self.theme = "light" if self.theme == "dark" else "dark"
+                self._panel_cache = None
             elif key == ord('i') or key == ord('I'):
                 self.show_instructions = not self.show_instructions
+            elif key == ord('h') or key == ord('H'):
+                self.show_hand_overlay = not self.show_hand_overlay
             elif key == ord('r') or key == ord('R'):
                 self.history.clear()
             elif key == ord('c') or key == ord('C'):
                 self.process_button_press('C')
         
+        stop_event.set()
+        producer.join()
         cap.release()
         cv2.destroyAllWindows()
+        
+        if self._capture_error is not None:
+            raise self._capture_error
         print("Calculator closed!")
 
 def main():